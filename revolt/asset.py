@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 from .enums import AssetType
 from .errors import AutumnDisabled
@@ -36,7 +37,7 @@ class Asset:
     type: :class:`AssetType`
         The type of asset it is
     """
-    __slots__ = ("state", "id", "tag", "size", "filename", "content_type", "width", "height", "type")
+    __slots__ = ("state", "id", "tag", "size", "filename", "content_type", "width", "height", "type", "__weakref__")
     
     def __init__(self, data: FilePayload, state: State):
         self.state = state
@@ -97,3 +98,15 @@ class Asset:
         base_url = self.state.api_info["features"]["autumn"]["url"]
 
         return f"{base_url}/{self.tag}/{self.id}"
+
+_asset_pool: WeakValueDictionary[str, Asset] = WeakValueDictionary()
+
+def _make_asset(data: FilePayload, state: State) -> Asset:
+    # assets are never mutated after creation so the same file can be shared while something still holds it
+    asset = _asset_pool.get(data["_id"])
+
+    if asset is None or asset.state is not state:
+        asset = Asset(data, state)
+        _asset_pool[asset.id] = asset
+
+    return asset
@@ -174,15 +174,13 @@ class ServerPermissions:
         self._server_perms = _Permission(server_perms)
         self._channel_perms = _Permission(channel_perms)
 
+    # these return new instances rather than mutating, as instances built from payloads are shared between servers
+
     def __add__(self, p: ServerPermissions) -> ServerPermissions:
-        self._server_perms += p._server_perms
-        self._channel_perms += p._channel_perms       
-        return self
+        return self.__class__(self._server_perms._value | p._server_perms._value, self._channel_perms._value | p._channel_perms._value)
     
     def __sub__(self, p: ServerPermissions) -> ServerPermissions:
-        self._server_perms -= p._server_perms
-        self._channel_perms -= p._channel_perms       
-        return self
+        return self.__class__(self._server_perms._value & ~p._server_perms._value, self._channel_perms._value & ~p._channel_perms._value)
 
     def __lt__(self, p: ServerPermissions) -> bool:
         return self._server_perms < p._server_perms and self._channel_perms < p._channel_perms
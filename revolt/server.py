@@ -1,23 +1,30 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, cast, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, Union
+from weakref import WeakKeyDictionary
 
-from .channel import Channel
+from .channel import Channel, TextChannel
 from .permissions import ServerPermissions
 from .role import Role
-from .asset import Asset
+from .asset import _make_asset
 from .category import Category
 
 if TYPE_CHECKING:
     from .member import Member
     from .state import State
-    from .channel import TextChannel
     from .types import (Server as ServerPayload, File as FilePayload, Permission as PermissionPayload, SystemMessagesConfig, Category as CategoryPayload)
 
 
 __all__ = ("Server", "SystemMessages")
 
+@lru_cache(maxsize=512)
+def _perm_cache(server_perms: int, channel_perms: int) -> ServerPermissions:
+    return ServerPermissions(server_perms, channel_perms)
+
 class SystemMessages:
+    __slots__ = ("state", "user_joined_id", "user_left_id", "user_kicked_id", "user_banned_id")
+
     def __init__(self, data: SystemMessagesConfig, state: State):
         self.state = state
         self.user_joined_id = data.get("user_joined")
@@ -25,41 +32,51 @@ class SystemMessages:
         self.user_kicked_id = data.get("user_kicked")
         self.user_banned_id = data.get("user_banned")
 
-    @property
-    def user_joined(self) -> Optional[TextChannel]:
-        if not self.user_joined_id:
+    def _resolve(self, channel_id: Optional[str]) -> Optional[TextChannel]:
+        if not channel_id:
             return
 
-        channel = self.state.get_channel(self.user_joined_id)
+        channel = self.state.get_channel(channel_id)
         assert isinstance(channel, TextChannel)
         return channel
 
     @property
-    def user_left(self) -> Optional[TextChannel]:
-        if not self.user_left_id:
-            return
+    def user_joined(self) -> Optional[TextChannel]:
+        return self._resolve(self.user_joined_id)
 
-        channel = self.state.get_channel(self.user_left_id)
-        assert isinstance(channel, TextChannel)
-        return channel
+    @property
+    def user_left(self) -> Optional[TextChannel]:
+        return self._resolve(self.user_left_id)
 
     @property
     def user_kicked(self) -> Optional[TextChannel]:
-        if not self.user_kicked_id:
-            return
-
-        channel = self.state.get_channel(self.user_kicked_id)
-        assert isinstance(channel, TextChannel)
-        return channel
+        return self._resolve(self.user_kicked_id)
 
     @property
     def user_banned(self) -> Optional[TextChannel]:
-        if not self.user_banned_id:
-            return
+        return self._resolve(self.user_banned_id)
 
-        channel = self.state.get_channel(self.user_banned_id)
-        assert isinstance(channel, TextChannel)
-        return channel
+class _EmptySystemMessages(SystemMessages):
+    # shared by every server without a config on a state, so it is frozen once constructed
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # user_banned_id is the last slot set by `SystemMessages.__init__`
+        if hasattr(self, "user_banned_id"):
+            raise AttributeError(f"{self.__class__.__name__} is shared between servers and cannot be modified")
+
+        super().__setattr__(name, value)
+
+_empty_system_messages: WeakKeyDictionary[State, SystemMessages] = WeakKeyDictionary()
+
+def _get_empty_system_messages(state: State) -> SystemMessages:
+    # an empty config never resolves a channel so one instance can be shared by every server on a state
+    system_messages = _empty_system_messages.get(state)
+
+    if system_messages is None:
+        system_messages = _empty_system_messages[state] = _EmptySystemMessages({}, state)
+
+    return system_messages
 
 class Server:
     """Represents a server
@@ -78,41 +95,55 @@ class Server:
         Whether the server is nsfw or not
     system_messages: :class:`SystemMessages`
         The system message config for the server
-    categories: list[:class:`Category`]
-        The categories in the server
     icon: Optional[:class:`Asset`]
         The servers icon
     banner: Optional[:class:`Asset`]
         The servers banner
     """
-    __slots__ = ("state", "id", "name", "owner_id", "default_permissions", "_members", "_roles", "_channels", "description", "icon", "banner", "nsfw", "system_messages", "categories")
+    __slots__ = ("state", "id", "name", "owner_id", "default_permissions", "_members", "_roles", "_channels", "description", "icon", "banner", "nsfw", "system_messages", "_categories_raw", "_categories", "_roles_sorted", "_members_list_cache", "_channels_list_cache")
 
     def __init__(self, data: ServerPayload, state: State):
+        g = data.get
+
         self.state = state
         self.id = data["_id"]
         self.name = data["name"]
         self.owner_id = data["owner"]
-        self.default_permissions = ServerPermissions(*data["default_permissions"])
-        self.description = data.get("description") or None
-        self.nsfw = data.get("nsfw", False)
-        self.system_messages = SystemMessages(data.get("system_messages", {}), state)
-        self.categories = [Category(data, state) for data in data.get("categories", [])]
-
-        if icon := data.get("icon"):
-            self.icon = Asset(icon, state)
+        self.default_permissions = _perm_cache(*data["default_permissions"])
+        self.description = g("description")
+        self.nsfw = g("nsfw", False)
+
+        if system_messages := g("system_messages"):
+            self.system_messages = SystemMessages(system_messages, state)
+        else:
+            self.system_messages = _get_empty_system_messages(state)
+
+        self._categories_raw: Union[list[CategoryPayload], tuple[()]] = g("categories") or ()
+        self._categories: Optional[list[Category]] = None
+
+        if icon := g("icon"):
+            self.icon = _make_asset(icon, state)
         else:
             self.icon = None
 
-        if banner := data.get("banner"):
-            self.banner = Asset(banner, state)
+        if banner := g("banner"):
+            self.banner = _make_asset(banner, state)
         else:
             self.banner  = None
 
         self._members: dict[str, Member] = {}
-        self._roles: dict[str, Role] = {role_id: Role(role, role_id, state, self) for role_id, role in data.get("roles", {}).items()}
 
-        channels = cast(list[Channel], list(filter(bool, [state.get_channel(channel_id) for channel_id in data["channels"]])))
-        self._channels: dict[str, Channel] = {channel.id: channel for channel in channels}
+        if roles_data := g("roles"):
+            self._roles: dict[str, Role] = {role_id: Role(role, role_id, state, self) for role_id, role in roles_data.items()}
+        else:
+            self._roles = {}
+
+        get_channel = state.get_channel
+        self._channels: dict[str, Channel] = {channel.id: channel for channel_id in data["channels"] if (channel := get_channel(channel_id)) is not None}
+
+        self._roles_sorted: Optional[tuple[Role, ...]] = None
+        self._members_list_cache: Optional[tuple[Member, ...]] = None
+        self._channels_list_cache: Optional[tuple[Channel, ...]] = None
 
     def _update(self, *, owner: Optional[str] = None, name: Optional[str] = None, description: Optional[str] = None, icon: Optional[FilePayload] = None, banner: Optional[FilePayload] = None, default_permissions: Optional[PermissionPayload] = None, nsfw: Optional[bool] = None, system_messages: Optional[SystemMessagesConfig] = None, categories: Optional[list[CategoryPayload]] = None):
         if owner:
@@ -122,32 +153,57 @@ class Server:
         if description is not None:
             self.description = description or None
         if icon:
-            self.icon = Asset(icon, self.state)
+            self.icon = _make_asset(icon, self.state)
         if banner:
-            self.banner = Asset(banner, self.state)
+            self.banner = _make_asset(banner, self.state)
         if default_permissions:
-            self.default_permissions = ServerPermissions(*default_permissions)
+            self.default_permissions = _perm_cache(*default_permissions)
         if nsfw is not None:
             self.nsfw = nsfw
         if system_messages is not None:
-            self.system_messages = SystemMessages(system_messages, self.state)
+            if system_messages:
+                self.system_messages = SystemMessages(system_messages, self.state)
+            else:
+                self.system_messages = _get_empty_system_messages(self.state)
         if categories is not None:
-            self.categories = [Category(data, self.state) for data in categories]
+            self._categories_raw = categories
+            self._categories = None
+
+    def _add_member(self, member: Member) -> None:
+        self._members[member.id] = member
+        self._members_list_cache = None
 
     @property
-    def roles(self) -> list[Role]:
-        """list[:class:`Role`] Gets all roles in the server in decending order"""
-        return list(self._roles.values())
+    def categories(self) -> list[Category]:
+        """list[:class:`Category`] Gets all categories in the server"""
+        if self._categories is None:
+            self._categories = [Category(data, self.state) for data in self._categories_raw]
+
+        return self._categories
+
+    @property
+    def roles(self) -> tuple[Role, ...]:
+        """tuple[:class:`Role`, ...] Gets all roles in the server in decending order"""
+        if self._roles_sorted is None:
+            self._roles_sorted = tuple(sorted(self._roles.values(), key=lambda role: role.rank, reverse=True))
+
+        return self._roles_sorted
     
     @property
-    def members(self) -> list[Member]:
-        """list[:class:`Member`] Gets all members in the server"""
-        return list(self._members.values())
+    def members(self) -> tuple[Member, ...]:
+        """tuple[:class:`Member`, ...] Gets all members in the server"""
+        if self._members_list_cache is None:
+            self._members_list_cache = tuple(self._members.values())
+
+        return self._members_list_cache
 
     @property
-    def channels(self) -> list[Channel]:
-        """list[:class:`Member`] Gets all channels in the server"""
-        return list(self._channels.values())
+    def channels(self) -> tuple[Channel, ...]:
+        """tuple[:class:`Channel`, ...] Gets all channels in the server"""
+        if self._channels_list_cache is None:
+            self._channels_list_cache = tuple(self._channels.values())
+
+        return self._channels_list_cache
 
     def get_role(self, role_id: str) -> Role:
         """Gets a role from the cache
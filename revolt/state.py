@@ -22,7 +22,7 @@ if TYPE_CHECKING:
 __all__ = ("State",)
 
 class State:
-    __slots__ = ("http", "api_info", "max_messages", "users", "channels", "servers", "messages")
+    __slots__ = ("http", "api_info", "max_messages", "users", "channels", "servers", "messages", "__weakref__")
 
     def __init__(self, http: HttpClient, api_info: ApiInfo, max_messages: int):
         self.http = http
@@ -55,7 +55,7 @@ class State:
     def add_member(self, server_id: str, payload: MemberPayload) -> Member:
         server = self.get_server(server_id)
         member = Member(payload, server, self)
-        server._members[member.id] = member
+        server._add_member(member)
 
         return member
 
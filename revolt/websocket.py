@@ -3,12 +3,11 @@ from __future__ import annotations
 import asyncio
 import logging
 from copy import copy
-from typing import TYPE_CHECKING, Callable, cast
+from typing import TYPE_CHECKING, Callable
 
 from .types import (ChannelCreateEventPayload, ChannelDeleteEventPayload,
                     ChannelDeleteTypingEventPayload,
                     ChannelStartTypingEventPayload, ChannelUpdateEventPayload, ServerUpdateEventPayload)
-from .types import Message as MessagePayload
 from .types import MessageDeleteEventPayload, MessageUpdateEventPayload
 
 try:
@@ -22,6 +21,14 @@ try:
 except ImportError:
     use_msgpack = False
 
+try:
+    import msgspec
+    json_decode = msgspec.json.decode
+    msgpack_decode = msgspec.msgpack.decode
+except ImportError:
+    json_decode = json.loads
+    msgpack_decode = None
+
 if TYPE_CHECKING:
     import aiohttp
 
@@ -100,7 +107,7 @@ class WebsocketHandler:
         self.dispatch("ready")
 
     async def handle_message(self, payload: MessageEventPayload):
-        message = self.state.add_message(cast(MessagePayload, payload))
+        message = self.state.add_message(payload)
         self.dispatch("message", message)
 
     async def handle_messageupdate(self, payload: MessageUpdateEventPayload):
@@ -196,10 +203,12 @@ class WebsocketHandler:
         await self.send_authenticate()
         asyncio.create_task(self.heartbeat())
 
+        if use_msgpack:
+            decode = msgpack_decode or msgpack.unpackb
+        else:
+            decode = json_decode
+
         async for msg in self.websocket:
-            if use_msgpack:
-                payload = msgpack.unpackb(msg.data)
-            else:
-                payload = json.loads(msg.data)
+            payload = decode(msg.data)
 
             self.loop.create_task(self.handle_event(payload))
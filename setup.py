@@ -30,7 +30,7 @@ setup(
     packages=find_packages(),
     python_requires=">=3.9",
     extras_require={
-        "speedups": ["ujson", "aiohttp[speedups]==3.7.4.post0", "msgpack==1.0.2"],
+        "speedups": ["ujson", "aiohttp[speedups]==3.7.4.post0", "msgpack==1.0.2", "msgspec==0.18.6"],
     },
     project_urls={
         "Bug Reports": "https://github.com/Zomatree/revolt.py/issues",